@@ -1,4 +1,6 @@
+import os
 import requests
+from requests_toolbelt import MultipartEncoder
 from app.core.config import (
     PEST_DISEASE_ROBOFLOW_API_KEY,
     PEST_DISEASE_ROBOFLOW_WORKFLOW_ID,
@@ -14,7 +16,13 @@ class RoboflowWorkflowClient:
             raise requests.HTTPError("Roboflow API key is not configured", response=None)
 
         with open(image_path, "rb") as img:
-            response = requests.post(url, params=params, files={"image": img}, timeout=15)
+            # The encoder reads the file as the body is sent, so memory stays at
+            # one chunk instead of the whole image copied into a multipart buffer
+            body = MultipartEncoder(fields={"image": (os.path.basename(image_path), img)})
+            response = requests.post(
+                url, params=params, data=body,
+                headers={"Content-Type": body.content_type}, timeout=15
+            )
 
         response.raise_for_status()
         return response.json()
@@ -1,5 +1,6 @@
 # Test script for distillation time prediction API
-import requests
+import asyncio
+import httpx
 import json
 
 # API endpoint
@@ -12,43 +13,60 @@ test_data = {
     "distillation_capacity_liters": 300.0
 }
 
-print("🧪 Testing Distillation Time Prediction API")
-print(f"📤 Request URL: {url}")
-print(f"📤 Request Body: {json.dumps(test_data, indent=2)}")
-print()
-
-try:
-    response = requests.post(url, json=test_data)
-    print(f"📥 Response Status: {response.status_code}")
-    
-    if response.status_code == 200:
-        result = response.json()
-        print("✅ SUCCESS!")
-        print(f"📊 Predicted Distillation Time: {result['predicted_time_hours']} hours")
-        print(f"📋 Input Summary: {json.dumps(result['input_summary'], indent=2)}")
-    else:
-        print(f"❌ ERROR: {response.status_code}")
-        print(f"Response: {response.text}")
-        
-except Exception as e:
-    print(f"❌ Error: {str(e)}")
-
 # Test with different parameters
-print("\n" + "="*60)
-print("Testing with Featherings & Chips, Sri Wijaya, 450L")
-
 test_data2 = {
     "plant_part": "Featherings & Chips",
     "cinnamon_type": "Sri Wijaya",
     "distillation_capacity_liters": 450.0
 }
 
-try:
-    response = requests.post(url, json=test_data2)
-    if response.status_code == 200:
-        result = response.json()
+
+async def post_prediction(client, data):
+    """POST one test case; returns the response, or the exception it raised"""
+    try:
+        return await client.post(url, json=data)
+    except Exception as e:
+        return e
+
+
+async def main():
+    print("🧪 Testing Distillation Time Prediction API")
+    print(f"📤 Request URL: {url}")
+    print(f"📤 Request Body: {json.dumps(test_data, indent=2)}")
+    print()
+
+    # Both requests are in flight at once over one keep-alive connection pool,
+    # so the run takes about one round trip instead of the sum of them
+    async with httpx.AsyncClient(timeout=10) as client:
+        response, response2 = await asyncio.gather(
+            post_prediction(client, test_data),
+            post_prediction(client, test_data2)
+        )
+
+    if isinstance(response, Exception):
+        print(f"❌ Error: {str(response)}")
+    else:
+        print(f"📥 Response Status: {response.status_code}")
+
+        if response.status_code == 200:
+            result = response.json()
+            print("✅ SUCCESS!")
+            print(f"📊 Predicted Distillation Time: {result['predicted_time_hours']} hours")
+            print(f"📋 Input Summary: {json.dumps(result['input_summary'], indent=2)}")
+        else:
+            print(f"❌ ERROR: {response.status_code}")
+            print(f"Response: {response.text}")
+
+    print("\n" + "="*60)
+    print("Testing with Featherings & Chips, Sri Wijaya, 450L")
+
+    if isinstance(response2, Exception):
+        print(f"❌ Error: {str(response2)}")
+    elif response2.status_code == 200:
+        result = response2.json()
         print(f"✅ Predicted Time: {result['predicted_time_hours']} hours")
     else:
-        print(f"❌ ERROR: {response.status_code}")
-except Exception as e:
-    print(f"❌ Error: {str(e)}")
+        print(f"❌ ERROR: {response2.status_code}")
+
+
+asyncio.run(main())
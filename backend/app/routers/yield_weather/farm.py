@@ -1,4 +1,6 @@
+from collections import defaultdict
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import delete, func, update
 from sqlmodel import Session, select
 from typing import List, Optional
 from datetime import datetime
@@ -202,43 +204,21 @@ async def delete_plot(plot_id: int, db: Session = Depends(get_session)):
     
     farm_id = plot.farm_id
     
-    # Delete all related records in the correct order (child tables first)
+    # Delete all related records in the correct order (child tables first), one
+    # DELETE per table instead of loading every row just to delete it
+    for model in (ActivityHistory, YieldPrediction, UserYieldRecord, PlantingRecord, FarmActivity):
+        db.execute(delete(model).where(model.plot_id == plot_id))
     
-    # 1. Delete ActivityHistory records
-    activity_histories = db.exec(select(ActivityHistory).where(ActivityHistory.plot_id == plot_id)).all()
-    for history in activity_histories:
-        db.delete(history)
-    
-    # 2. Delete YieldPrediction records
-    yield_predictions = db.exec(select(YieldPrediction).where(YieldPrediction.plot_id == plot_id)).all()
-    for prediction in yield_predictions:
-        db.delete(prediction)
-    
-    # 3. Delete UserYieldRecord records
-    user_yield_records = db.exec(select(UserYieldRecord).where(UserYieldRecord.plot_id == plot_id)).all()
-    for yield_record in user_yield_records:
-        db.delete(yield_record)
-    
-    # 4. Delete PlantingRecords
-    planting_records = db.exec(select(PlantingRecord).where(PlantingRecord.plot_id == plot_id)).all()
-    for record in planting_records:
-        db.delete(record)
-    
-    # 5. Delete FarmActivities where plot_id matches
-    farm_activities = db.exec(select(FarmActivity).where(FarmActivity.plot_id == plot_id)).all()
-    for activity in farm_activities:
-        db.delete(activity)
-    
-    # 6. Finally delete the plot itself
+    # Finally delete the plot itself
     db.delete(plot)
     db.commit()
     
     # Update farm's num_plots count
     farm = db.get(Farm, farm_id)
     if farm:
-        plots_query = db.exec(select(Plot).where(Plot.farm_id == farm_id))
-        actual_plots_count = len(list(plots_query))
-        farm.num_plots = actual_plots_count
+        farm.num_plots = db.exec(
+            select(func.count()).select_from(Plot).where(Plot.farm_id == farm_id)
+        ).one()
         farm.updated_at = datetime.utcnow()
         db.add(farm)
         db.commit()
@@ -553,39 +533,36 @@ async def update_all_plot_ages(db: Session = Depends(get_session)):
     Update age_months for all plots that have planting_date set.
     This endpoint recalculates and updates age based on planting dates.
     """
-    # Get all plots that have planting_date
+    # Get all plots that have planting_date, only the columns the age update needs
     plots_with_planting_date = db.exec(
-        select(Plot).where(Plot.planting_date.is_not(None))
+        select(Plot.id, Plot.name, Plot.planting_date, Plot.age_months)
+        .where(Plot.planting_date.is_not(None))
     ).all()
     
     updated_plots = []
+    age_updates = []
     current_time = datetime.utcnow()
     
     for plot in plots_with_planting_date:
-        if plot.planting_date:
-            # Calculate new age
-            time_diff = current_time - plot.planting_date
-            days_diff = time_diff.days
-            months_diff = days_diff / 30.44  # Average month length
-            new_age_months = int(round(months_diff))
-            
-            # Store old age for reporting
-            old_age_months = plot.age_months
-            
-            # Update age
-            plot.age_months = new_age_months
-            plot.updated_at = current_time
-            
-            db.add(plot)
-            updated_plots.append({
-                "plot_id": plot.id,
-                "plot_name": plot.name,
-                "planting_date": plot.planting_date.isoformat(),
-                "old_age_months": old_age_months,
-                "new_age_months": new_age_months,
-                "calculated_days": days_diff
-            })
-    
+        # Calculate new age
+        time_diff = current_time - plot.planting_date
+        days_diff = time_diff.days
+        months_diff = days_diff / 30.44  # Average month length
+        new_age_months = int(round(months_diff))
+        
+        age_updates.append({"id": plot.id, "age_months": new_age_months, "updated_at": current_time})
+        updated_plots.append({
+            "plot_id": plot.id,
+            "plot_name": plot.name,
+            "planting_date": plot.planting_date.isoformat(),
+            "old_age_months": plot.age_months,
+            "new_age_months": new_age_months,
+            "calculated_days": days_diff
+        })
+    
+    # One executemany UPDATE keyed by primary key instead of a flushed UPDATE per plot
+    if age_updates:
+        db.execute(update(Plot), age_updates)
     db.commit()
     
     return {
@@ -714,11 +691,13 @@ async def get_predicted_yields(user_id: int, location: Optional[str] = None, db:
     
     predicted_yields = []
     
+    # Get the plots of every farm in one query, bucketed by farm, instead of one query per farm
+    plots_by_farm = defaultdict(list)
+    for plot in db.exec(select(Plot).where(Plot.farm_id.in_([farm.id for farm in farms]))).all():
+        plots_by_farm[plot.farm_id].append(plot)
+    
     for farm in farms:
-        # Get all plots for this farm
-        plots = db.exec(select(Plot).where(Plot.farm_id == farm.id)).all()
-        
-        for plot in plots:
+        for plot in plots_by_farm[farm.id]:
             # Skip plots if location filter is provided and doesn't match
             if location and farm.location and location.lower() not in farm.location.lower():
                 continue
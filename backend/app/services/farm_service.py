@@ -102,24 +102,26 @@ class FarmService(BaseService):
         # Get all plots for this farm
         plots = self.db.exec(select(Plot).where(Plot.farm_id == farm_id)).all()
         
-        # Calculate statistics
-        farm.active_plots_count = len([p for p in plots if p.status in ['GROWING', 'HARVESTING', 'MATURE']])
+        # Calculate statistics in a single pass over the plots
+        active_plots = 0
+        total_yield = 0.0
+        last_activity_date = None
+        for plot in plots:
+            if plot.status in ('GROWING', 'HARVESTING', 'MATURE'):
+                active_plots += 1
+            total_yield += plot.total_yield_kg or 0
+            
+            # Find last activity date
+            for activity_date in (plot.last_yield_date, plot.last_planting_date):
+                if activity_date and (last_activity_date is None or activity_date > last_activity_date):
+                    last_activity_date = activity_date
+        
+        farm.active_plots_count = active_plots
         farm.num_plots = len(plots)  # Update actual plot count
-        
-        # Calculate total yield from all plots
-        total_yield = sum(plot.total_yield_kg or 0 for plot in plots)
         farm.total_yield_kg = total_yield
         
-        # Find last activity date
-        last_activity_dates = []
-        for plot in plots:
-            if plot.last_yield_date:
-                last_activity_dates.append(plot.last_yield_date)
-            if plot.last_planting_date:
-                last_activity_dates.append(plot.last_planting_date)
-        
-        if last_activity_dates:
-            farm.last_activity_date = max(last_activity_dates)
+        if last_activity_date:
+            farm.last_activity_date = last_activity_date
         
         farm.updated_at = datetime.utcnow()
         
@@ -2,14 +2,17 @@
 Plot-level ML model for yield prediction
 Uses trained model to predict plot-level yield based on environmental and management factors
 """
-import pandas as pd
 import numpy as np
 import joblib
+import json
 import os
-from typing import Dict, Any, Optional
+import sys
+from typing import Dict, Any, List, Optional
 from sqlmodel import Session
 import logging
 
+from app.utils.model_runtime import configure_prediction_threads
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +25,9 @@ class PlotLevelYieldModel:
         # Model paths
         self.models_dir = "models/yield_weather/plot_level"
         
+        self.bundle_path = f"{self.models_dir}/plot_yield_bundle.joblib"
+        
+        # Legacy per-component artifacts
         self.model_path = f"{self.models_dir}/plot_yield_model.joblib"
         self.scaler_path = f"{self.models_dir}/plot_yield_scaler.joblib"
         self.encoders_path = f"{self.models_dir}/plot_yield_encoders.joblib"
@@ -32,19 +38,38 @@ class PlotLevelYieldModel:
         self.encoders = {}
         self.feature_names = []
         
+        # Single-prediction fast path state (filled once the model is loaded)
+        self._lookups = {}
+        self._scaler_mean = None
+        self._scaler_scale = None
+        
         # Load model on initialization
         self._load_model()
     
     def _load_model(self) -> bool:
         """Load pre-trained plot yield model"""
         try:
-            if all(os.path.exists(p) for p in [self.model_path, self.scaler_path, self.encoders_path]):
-                self.model = joblib.load(self.model_path)
+            if os.path.exists(self.bundle_path):
+                # Single-file bundle: one read for every component
+                bundle = joblib.load(self.bundle_path)
+                self.model = bundle['model']
+                self.scaler = bundle['scaler']
+                self.encoders = bundle['encoders']
+                self.feature_names = bundle['feature_names']
+                self._build_prediction_cache()
+                
+                logger.info("✅ Plot yield model loaded successfully")
+                return True
+            elif all(os.path.exists(p) for p in [self.model_path, self.scaler_path, self.encoders_path]):
+                # Legacy model files are uncompressed, so memory-map the tree arrays:
+                # every worker process loading the model shares the same pages
+                self.model = joblib.load(self.model_path, mmap_mode='r')
                 self.scaler = joblib.load(self.scaler_path)
                 
                 encoders_data = joblib.load(self.encoders_path)
                 self.encoders = encoders_data['encoders']
                 self.feature_names = encoders_data['feature_names']
+                self._build_prediction_cache()
                 
                 logger.info("✅ Plot yield model loaded successfully")
                 return True
@@ -58,15 +83,28 @@ class PlotLevelYieldModel:
     
     def model_available(self) -> bool:
         """Check if model is loaded and available"""
+        # scaler may be None: bundled tree models are trained on unscaled features
         return (self.model is not None and 
-                self.scaler is not None and 
                 len(self.encoders) > 0)
     
-    def _prepare_plot_features(self, plot_data: Dict[str, Any]) -> pd.DataFrame:
-        """Prepare features for prediction matching training format"""
+    def _build_prediction_cache(self) -> None:
+        """Precompute encoder lookups, scaler parameters and a reusable input row"""
+        configure_prediction_threads(self.model)
+        self._lookups = {
+            col: {cls: idx for idx, cls in enumerate(encoder.classes_)}
+            for col, encoder in self.encoders.items()
+        }
+        if self.scaler is not None:
+            self._scaler_mean = self.scaler.mean_.astype(np.float32)
+            self._scaler_scale = self.scaler.scale_.astype(np.float32)
+        else:
+            self._scaler_mean = self._scaler_scale = None
+    
+    def _fill_feature_row(self, plot_data: Dict[str, Any], row: np.ndarray) -> None:
+        """Write one plot's features into a 1-D row in training order, matching training format"""
         
         # Base input data (matching training data format)
-        input_data = {
+        values = {
             'area_hectares': float(plot_data.get('area_hectares', 1.0)),
             'rainfall_mm': float(plot_data.get('rainfall_mm', 2500.0)),
             'temperature_c': float(plot_data.get('temperature_c', 26.0)),
@@ -74,43 +112,71 @@ class PlotLevelYieldModel:
             'avg_stem_diameter_mm': float(plot_data.get('avg_stem_diameter_mm', 45.0)),
             'min_stem_diameter_mm': float(plot_data.get('min_stem_diameter_mm', 35.0)),
             'max_stem_diameter_mm': float(plot_data.get('max_stem_diameter_mm', 55.0)),
-            'fertilizer_used_plot': bool(plot_data.get('fertilizer_used_plot', True)),
-            'location': str(plot_data.get('location', 'Galle')),
-            'variety': str(plot_data.get('variety', 'Sri Gemunu')),
-            'soil_type': str(plot_data.get('soil_type', 'Loamy')),
-            'disease_present_plot': str(plot_data.get('disease_present_plot', 'mild'))
         }
         
-        df = pd.DataFrame([input_data])
-        
-        # Handle missing values (matching training preprocessing)
-        df['variety'] = df['variety'].fillna('Sri Gemunu')
-        df['disease_present_plot'] = df['disease_present_plot'].fillna('mild')
-        
-        # Encode categorical variables using loaded encoders
-        categorical_features = ['location', 'variety', 'soil_type', 'disease_present_plot']
-        
-        for col in categorical_features:
-            if col in self.encoders:
-                try:
-                    # Get the value and handle unseen categories
-                    value = df[col].iloc[0]
-                    if value in self.encoders[col].classes_:
-                        df[f'{col}_encoded'] = self.encoders[col].transform([value])[0]
-                    else:
-                        # Use the most common class (first class) for unseen values
-                        df[f'{col}_encoded'] = 0
-                        logger.debug(f"Unknown {col} value '{value}', using default encoding")
-                except Exception as e:
-                    logger.warning(f"Encoding error for {col}: {e}, using default")
-                    df[f'{col}_encoded'] = 0
+        # Encode categorical variables with the precomputed lookups; unseen
+        # categories use the most common class (first class)
+        categorical_defaults = {
+            'location': 'Galle',
+            'variety': 'Sri Gemunu',
+            'soil_type': 'Loamy',
+            'disease_present_plot': 'mild'
+        }
+        for col, default in categorical_defaults.items():
+            if col in self._lookups:
+                value = str(plot_data.get(col, default))
+                code = self._lookups[col].get(value)
+                if code is None:
+                    logger.debug(f"Unknown {col} value '{value}', using default encoding")
+                    code = 0
+                values[f'{col}_encoded'] = code
         
         # Create engineered features (matching training)
-        df['fertilizer_used_int'] = df['fertilizer_used_plot'].astype(int)
-        df['diameter_range'] = df['max_stem_diameter_mm'] - df['min_stem_diameter_mm']
-        df['climate_index'] = df['rainfall_mm'] / df['temperature_c']
+        values['fertilizer_used_int'] = int(bool(plot_data.get('fertilizer_used_plot', True)))
+        values['diameter_range'] = values['max_stem_diameter_mm'] - values['min_stem_diameter_mm']
+        values['climate_index'] = values['rainfall_mm'] / values['temperature_c']
         
-        return df
+        # Missing feature names raise KeyError, which callers treat as a failed prediction
+        for i, name in enumerate(self.feature_names):
+            row[i] = values[name]
+    
+    def _predict_matrix(self, X: np.ndarray) -> np.ndarray:
+        """Scale (legacy models with a scaler only) in place and predict every row at once"""
+        if self._scaler_mean is not None:
+            X -= self._scaler_mean
+            X /= self._scaler_scale
+        return self.model.predict(X)
+    
+    def _predict_one(self, plot_data: Dict[str, Any]) -> float:
+        """Predict a single plot from one float32 row, skipping any DataFrame build"""
+        # Allocated per call: the service is shared across request threads, and
+        # _predict_matrix scales the row in place
+        X = np.empty((1, len(self.feature_names)), dtype=np.float32)
+        self._fill_feature_row(plot_data, X[0])
+        return float(self._predict_matrix(X)[0])
+    
+    def predict_plot_yield_batch(self, plots: List[Dict[str, Any]]) -> List[float]:
+        """Predict total yield for many plots with a single model.predict call"""
+        if not plots:
+            return []
+        if not self.model_available():
+            # Fallback calculation per plot
+            return [self.predict_plot_yield(plot_data) for plot_data in plots]
+        
+        try:
+            # One (N, F) matrix, one scaling pass and one batched tree traversal
+            X = np.empty((len(plots), len(self.feature_names)), dtype=np.float32)
+            for i, plot_data in enumerate(plots):
+                self._fill_feature_row(plot_data, X[i])
+            
+            # Ensure reasonable bounds
+            predictions = np.clip(self._predict_matrix(X), 50, 20000)
+            return predictions.tolist()
+            
+        except Exception as e:
+            logger.error(f"❌ Batch plot yield prediction failed: {e}")
+            # Fallback calculation
+            return [max(100, plot_data.get('area_hectares', 1.0) * 2500) for plot_data in plots]
     
     def predict_plot_yield(self, plot_data: Dict[str, Any]) -> float:
         """Predict total yield for a plot using trained model"""
@@ -131,17 +197,8 @@ class PlotLevelYieldModel:
             return max(100, total_yield)
         
         try:
-            # Prepare features
-            df = self._prepare_plot_features(plot_data)
-            
-            # Select features in training order
-            X = df[self.feature_names]
-            
-            # Scale features
-            X_scaled = self.scaler.transform(X)
-            
             # Predict
-            prediction = self.model.predict(X_scaled)[0]
+            prediction = self._predict_one(plot_data)
             
             # Ensure reasonable bounds
             prediction = max(50, min(20000, prediction))
@@ -204,4 +261,36 @@ class PlotLevelYieldModel:
             if not isinstance(temp, (int, float)) or temp < 15 or temp > 40:
                 errors.append("temperature_c must be between 15 and 40")
         
-        return len(errors) == 0, errors
\ No newline at end of file
+        return len(errors) == 0, errors
+
+
+def serve(stream_in=sys.stdin, stream_out=sys.stdout) -> None:
+    """
+    Load the model once and answer newline-delimited JSON requests.
+
+    Each input line is a plot_data object (or a list of them for a batch);
+    each output line is {"predicted_yield": ...} / {"predicted_yields": [...]}
+    or {"error": ...}. Callers pay the sklearn import and model load only once.
+    """
+    model = PlotLevelYieldModel(db=None)
+    for line in stream_in:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+            if isinstance(request, list):
+                response = {"predicted_yields": model.predict_plot_yield_batch(request)}
+            else:
+                response = {"predicted_yield": model.predict_plot_yield(request)}
+        except Exception as e:
+            response = {"error": str(e)}
+        stream_out.write(json.dumps(response) + "\n")
+        stream_out.flush()
+
+
+if __name__ == "__main__":
+    if "--serve" in sys.argv[1:]:
+        serve()
+    else:
+        print("Usage: python -m app.services.plot_level_yield_model --serve")
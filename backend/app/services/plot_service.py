@@ -2,6 +2,7 @@
 Plot service with cascade logic implementation
 """
 from typing import List, Optional, Dict, Any
+from sqlalchemy import func
 from sqlmodel import Session, select
 from datetime import datetime, timedelta
 
@@ -128,9 +129,9 @@ class PlotService(BaseService):
                 plot.status = 'GROWING'
         
         # Update count
-        plot.planting_records_count = len(list(self.db.exec(
-            select(PlantingRecord).where(PlantingRecord.plot_id == plot_id)
-        ).all()))
+        plot.planting_records_count = self.db.exec(
+            select(func.count()).select_from(PlantingRecord).where(PlantingRecord.plot_id == plot_id)
+        ).one()
         
         plot.last_planting_date = latest_planting.planted_date if latest_planting else None
         plot.updated_at = datetime.utcnow()
@@ -142,20 +143,23 @@ class PlotService(BaseService):
         """Update plot fields after a yield record is created"""
         plot = self.get_plot(plot_id)
         
-        # Get all yield records for this plot
-        yield_records = list(self.db.exec(
-            select(UserYieldRecord)
-            .where(UserYieldRecord.plot_id == plot_id)
-            .order_by(UserYieldRecord.yield_date.desc())
-        ).all())
-        
-        if yield_records:
+        # Yield statistics aggregated server-side instead of loading every record
+        records_count, total_yield, best_yield, last_yield_date = self.db.exec(
+            select(
+                func.count(),
+                func.sum(UserYieldRecord.yield_amount),
+                func.max(UserYieldRecord.yield_amount),
+                func.max(UserYieldRecord.yield_date)
+            ).where(UserYieldRecord.plot_id == plot_id)
+        ).one()
+        
+        if records_count:
             # Update yield statistics
-            plot.yield_records_count = len(yield_records)
-            plot.total_yield_kg = sum(record.yield_amount for record in yield_records)
-            plot.average_yield_per_harvest = plot.total_yield_kg / len(yield_records)
-            plot.best_yield_kg = max(record.yield_amount for record in yield_records)
-            plot.last_yield_date = yield_records[0].yield_date
+            plot.yield_records_count = records_count
+            plot.total_yield_kg = total_yield
+            plot.average_yield_per_harvest = total_yield / records_count
+            plot.best_yield_kg = best_yield
+            plot.last_yield_date = last_yield_date
             
             # Update status
             plot.status = 'HARVESTED'
@@ -178,11 +182,9 @@ class PlotService(BaseService):
         plot = self.get_plot(plot_id)
         
         # Count trees
-        trees_count = len(list(self.db.exec(
-            select(Tree).where(Tree.plot_id == plot_id)
-        ).all()))
-        
-        plot.trees_count = trees_count
+        plot.trees_count = self.db.exec(
+            select(func.count()).select_from(Tree).where(Tree.plot_id == plot_id)
+        ).one()
         plot.updated_at = datetime.utcnow()
         
         self.db.add(plot)
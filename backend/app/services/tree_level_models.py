@@ -42,6 +42,10 @@ class TreeLevelMLModels:
         self.weight_encoders = {}
         self.weight_feature_names = None
         
+        # Per-column {class: code} dicts for _safe_encode, kept next to the encoder
+        # they were built from so a refit or reload rebuilds them
+        self._encoder_lookups = {}
+        
         # Model paths
         self.models_dir = "models/yield_weather/tree_level"
         os.makedirs(self.models_dir, exist_ok=True)
@@ -95,41 +99,50 @@ class TreeLevelMLModels:
     
     def engineer_tree_features(self, df: pd.DataFrame, is_training: bool = True) -> pd.DataFrame:
         """Advanced feature engineering for tree-level data"""
-        features = df.copy()
-        
-        # Handle missing values
-        features['tree_age_years'] = features['tree_age_years'].fillna(3.0)
-        features['rainfall_recent_mm'] = features['rainfall_recent_mm'].fillna(2500)
-        features['temperature_recent_c'] = features['temperature_recent_c'].fillna(26.0)
-        features['num_existing_stems'] = features['num_existing_stems'].fillna(3)
-        
-        # Core engineered features from project spec
-        features['diameter_to_cane_interaction'] = features['stem_diameter_mm'] * features['tree_age_years']
-        features['climate_response'] = features['rainfall_recent_mm'] * features['temperature_recent_c']
+        # Collect output columns by reference instead of deep-copying df up front;
+        # the DataFrame constructor copies them once at the end, so the result never
+        # shares memory with the caller's frame
+        columns = {col: df[col] for col in df.columns}
+        
+        # Handle missing values with column-specific defaults, working on the raw
+        # arrays instead of going through pandas' fillna machinery
+        filled = {}
+        for col, default in (('tree_age_years', 3.0), ('rainfall_recent_mm', 2500.0),
+                             ('temperature_recent_c', 26.0), ('num_existing_stems', 3.0)):
+            values = df[col].to_numpy(dtype=float)
+            filled[col] = np.where(np.isnan(values), default, values)
+            columns[col] = filled[col]
+        stem_diameter = df['stem_diameter_mm'].to_numpy(dtype=float)
+        
+        # Core engineered features from project spec (one product array each, no
+        # intermediate Series)
+        columns['diameter_to_cane_interaction'] = stem_diameter * filled['tree_age_years']
+        columns['climate_response'] = filled['rainfall_recent_mm'] * filled['temperature_recent_c']
         
         # Fertilizer boost factor
-        features['fertilizer_boost_factor'] = features['fertilizer_used'].astype(float)
+        # copy=True: for a float64 column to_numpy returns a view of the caller's data
+        boost = df['fertilizer_used'].to_numpy(dtype=float, copy=True)
         # Enhanced boost for organic fertilizers
-        if 'fertilizer_type' in features.columns:
-            organic_mask = features['fertilizer_type'].fillna('').str.contains('organic', case=False)
-            features.loc[organic_mask, 'fertilizer_boost_factor'] = 1.2
-            compost_mask = features['fertilizer_type'].fillna('').str.contains('compost', case=False)
-            features.loc[compost_mask, 'fertilizer_boost_factor'] = 1.15
+        if 'fertilizer_type' in df.columns:
+            fertilizer_type = df['fertilizer_type'].fillna('')
+            boost[fertilizer_type.str.contains('organic', case=False).to_numpy()] = 1.2
+            boost[fertilizer_type.str.contains('compost', case=False).to_numpy()] = 1.15
+        columns['fertilizer_boost_factor'] = boost
         
         # Disease stress factor
         disease_mapping = {'none': 1.0, 'mild': 0.85, 'severe': 0.6}
-        features['disease_stress_factor'] = features['disease_status'].map(disease_mapping).fillna(1.0)
+        columns['disease_stress_factor'] = df['disease_status'].map(disease_mapping).fillna(1.0).to_numpy()
         
         # Diameter categories for non-linear effects
-        features['diameter_category'] = pd.cut(
-            features['stem_diameter_mm'], 
+        columns['diameter_category'] = pd.cut(
+            stem_diameter, 
             bins=[0, 40, 45, 50, 100], 
             labels=['small', 'medium', 'large', 'very_large']
         ).astype(str)
         
         # Age categories
-        features['age_category'] = pd.cut(
-            features['tree_age_years'],
+        columns['age_category'] = pd.cut(
+            filled['tree_age_years'],
             bins=[0, 3, 5, 7, 100],
             labels=['young', 'mature', 'prime', 'old']
         ).astype(str)
@@ -141,31 +154,37 @@ class TreeLevelMLModels:
         if is_training:
             # Fit encoders during training
             for col in categorical_cols:
-                if col in features.columns:
+                if col in columns:
                     encoder = LabelEncoder()
                     # Handle missing values
-                    features[col] = features[col].fillna('unknown')
-                    features[f'{col}_encoded'] = encoder.fit_transform(features[col])
+                    values = pd.Series(columns[col], index=df.index).fillna('unknown')
+                    columns[col] = values
+                    columns[f'{col}_encoded'] = encoder.fit_transform(values)
                     self.cane_encoders[col] = encoder
                     self.weight_encoders[col] = encoder
         else:
             # Use existing encoders for prediction
             for col in categorical_cols:
-                if col in features.columns and col in self.cane_encoders:
-                    features[col] = features[col].fillna('unknown')
-                    features[f'{col}_encoded'] = self._safe_encode(features[col], self.cane_encoders[col])
+                if col in columns and col in self.cane_encoders:
+                    values = pd.Series(columns[col], index=df.index).fillna('unknown')
+                    columns[col] = values
+                    columns[f'{col}_encoded'] = self._safe_encode(col, values, self.cane_encoders[col])
         
-        return features
+        return pd.DataFrame(columns, index=df.index, copy=True)
     
-    def _safe_encode(self, values, encoder):
+    def _safe_encode(self, col, values, encoder):
         """Safely encode values, handling unseen categories"""
-        encoded = []
-        for val in values:
-            if val in encoder.classes_:
-                encoded.append(encoder.transform([val])[0])
-            else:
-                # Use most common class for unseen values
-                encoded.append(0)
+        # One hashed dict lookup per value instead of a classes_ scan plus a
+        # transform() call per element; the dict is built once per encoder and
+        # cached on the service, so nothing extra is pickled with the encoder
+        cached = self._encoder_lookups.get(col)
+        if cached is None or cached[0] is not encoder:
+            cached = (encoder, {cls: idx for idx, cls in enumerate(encoder.classes_)})
+            self._encoder_lookups[col] = cached
+        lookup = cached[1]
+        # Use most common class (0) for unseen values
+        return values.map(lookup).fillna(0).astype(np.int32).to_numpy()
+    
     def _generate_synthetic_tree_data(self, n_samples: int = 1000) -> pd.DataFrame:
         """Generate synthetic tree data for model training"""
         np.random.seed(42)  # For reproducibility
@@ -319,9 +338,10 @@ class TreeLevelMLModels:
         # Feature engineering
         features_df = self.engineer_tree_features(df, is_training=True)
         
-        # Prepare features
+        # Prepare features (float32 is what sklearn trees split on internally, so this
+        # halves the matrix without changing results)
         self.cane_feature_names = self.prepare_cane_prediction_features(features_df)
-        X = features_df[self.cane_feature_names]
+        X = features_df[self.cane_feature_names].astype(np.float32, copy=False)
         y = df['actual_canes']
         
         # Split data
@@ -350,6 +370,9 @@ class TreeLevelMLModels:
                 learning_rate=0.1,
                 min_samples_split=5,
                 min_samples_leaf=2,
+                n_iter_no_change=20,
+                validation_fraction=0.15,
+                tol=1e-4,
                 random_state=42
             )
         }
@@ -442,7 +465,7 @@ class TreeLevelMLModels:
         
         # Prepare features
         self.weight_feature_names = self.prepare_weight_prediction_features(features_df)
-        X = features_df[self.weight_feature_names]
+        X = features_df[self.weight_feature_names].astype(np.float32, copy=False)
         y = df['actual_fresh_weight_kg']
         
         # Split data
@@ -463,6 +486,9 @@ class TreeLevelMLModels:
                 learning_rate=0.1,
                 min_samples_split=5,
                 min_samples_leaf=2,
+                n_iter_no_change=20,
+                validation_fraction=0.15,
+                tol=1e-4,
                 random_state=42
             ),
             'RandomForest': RandomForestRegressor(
@@ -561,7 +587,7 @@ class TreeLevelMLModels:
             df['fertilizer_used_int'] = df['fertilizer_used'].astype(int)
             
             # Select features in correct order
-            X = df[feature_names]
+            X = df[feature_names].astype(np.float32, copy=False)
             X_scaled = self.cane_scaler.transform(X)
             
             prediction = self.cane_model.predict(X_scaled)[0]
@@ -613,7 +639,7 @@ class TreeLevelMLModels:
             df['fertilizer_used_int'] = df['fertilizer_used'].astype(int)
             
             # Select features in correct order
-            X = df[feature_names]
+            X = df[feature_names].astype(np.float32, copy=False)
             X_scaled = self.weight_scaler.transform(X)
             
             prediction = self.weight_model.predict(X_scaled)[0]
@@ -12,6 +12,8 @@ from typing import Dict, Any, Tuple, List, Optional
 from sqlmodel import Session
 import logging
 
+from app.utils.model_runtime import configure_prediction_threads
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +26,10 @@ class TreeLevelMLModels:
         # Model paths
         self.models_dir = "models/yield_weather/tree_level"
         
+        self.cane_bundle_path = f"{self.models_dir}/tree_cane_bundle.joblib"
+        self.weight_bundle_path = f"{self.models_dir}/tree_weight_bundle.joblib"
+        
+        # Legacy per-component artifacts
         self.cane_model_path = f"{self.models_dir}/tree_cane_model.joblib"
         self.cane_scaler_path = f"{self.models_dir}/tree_cane_scaler.joblib"
         self.cane_encoders_path = f"{self.models_dir}/tree_cane_encoders.joblib"
@@ -49,9 +55,19 @@ class TreeLevelMLModels:
     def _load_models(self) -> bool:
         """Load pre-trained models"""
         try:
-            # Load cane model
-            if all(os.path.exists(p) for p in [self.cane_model_path, self.cane_scaler_path, self.cane_encoders_path]):
-                self.cane_model = joblib.load(self.cane_model_path)
+            # Load cane model (single-file bundle first, then legacy artifacts)
+            if os.path.exists(self.cane_bundle_path):
+                bundle = joblib.load(self.cane_bundle_path)
+                self.cane_model = bundle['model']
+                self.cane_scaler = bundle['scaler']
+                self.cane_encoders = bundle['encoders']
+                self.cane_feature_names = bundle['feature_names']
+                
+                logger.info("✅ Cane prediction model loaded successfully")
+            elif all(os.path.exists(p) for p in [self.cane_model_path, self.cane_scaler_path, self.cane_encoders_path]):
+                # Legacy model files are uncompressed, so memory-map the tree arrays:
+                # every worker process loading the model shares the same pages
+                self.cane_model = joblib.load(self.cane_model_path, mmap_mode='r')
                 self.cane_scaler = joblib.load(self.cane_scaler_path)
                 
                 encoders_data = joblib.load(self.cane_encoders_path)
@@ -62,9 +78,17 @@ class TreeLevelMLModels:
             else:
                 logger.warning("❌ Cane model files not found")
             
-            # Load weight model
-            if all(os.path.exists(p) for p in [self.weight_model_path, self.weight_scaler_path, self.weight_encoders_path]):
-                self.weight_model = joblib.load(self.weight_model_path)
+            # Load weight model (single-file bundle first, then legacy artifacts)
+            if os.path.exists(self.weight_bundle_path):
+                bundle = joblib.load(self.weight_bundle_path)
+                self.weight_model = bundle['model']
+                self.weight_scaler = bundle['scaler']
+                self.weight_encoders = bundle['encoders']
+                self.weight_feature_names = bundle['feature_names']
+                
+                logger.info("✅ Weight prediction model loaded successfully")
+            elif all(os.path.exists(p) for p in [self.weight_model_path, self.weight_scaler_path, self.weight_encoders_path]):
+                self.weight_model = joblib.load(self.weight_model_path, mmap_mode='r')
                 self.weight_scaler = joblib.load(self.weight_scaler_path)
                 
                 encoders_data = joblib.load(self.weight_encoders_path)
@@ -75,6 +99,9 @@ class TreeLevelMLModels:
             else:
                 logger.warning("❌ Weight model files not found")
             
+            configure_prediction_threads(self.cane_model)
+            configure_prediction_threads(self.weight_model)
+            
             return self.models_available()
             
         except Exception as e:
@@ -83,10 +110,9 @@ class TreeLevelMLModels:
     
     def models_available(self) -> bool:
         """Check if both models are loaded and available"""
+        # Scalers may be None: bundled tree models are trained on unscaled features
         return (self.cane_model is not None and 
-                self.weight_model is not None and 
-                self.cane_scaler is not None and 
-                self.weight_scaler is not None)
+                self.weight_model is not None)
     
     def _prepare_tree_features(self, tree_data: Dict[str, Any], predicted_canes: Optional[float] = None) -> pd.DataFrame:
         """Prepare features for prediction matching training format"""
@@ -162,11 +188,11 @@ class TreeLevelMLModels:
             # Prepare features
             df = self._prepare_tree_features(tree_data)
             
-            # Select features in training order
-            X = df[self.cane_feature_names]
+            # Select features in training order, as float32 to match the trees' internal dtype
+            X = df[self.cane_feature_names].astype(np.float32, copy=False)
             
-            # Scale features
-            X_scaled = self.cane_scaler.transform(X)
+            # Scale features (legacy models only)
+            X_scaled = self.cane_scaler.transform(X) if self.cane_scaler is not None else X
             
             # Predict
             prediction = self.cane_model.predict(X_scaled)[0]
@@ -204,10 +230,10 @@ class TreeLevelMLModels:
             df = self._prepare_tree_features(tree_data, predicted_canes)
             
             # Select features in training order
-            X = df[self.weight_feature_names]
+            X = df[self.weight_feature_names].astype(np.float32, copy=False)
             
-            # Scale features
-            X_scaled = self.weight_scaler.transform(X)
+            # Scale features (legacy models only)
+            X_scaled = self.weight_scaler.transform(X) if self.weight_scaler is not None else X
             
             # Predict
             prediction = self.weight_model.predict(X_scaled)[0]
@@ -0,0 +1,22 @@
+"""
+Runtime tuning for loaded scikit-learn models
+"""
+import sys
+from typing import Any
+
+# True only on free-threaded CPython builds (3.13t+) running with the GIL disabled
+FREE_THREADED = getattr(sys, "_is_gil_enabled", lambda: True)() is False
+
+
+def configure_prediction_threads(model: Any) -> None:
+    """
+    Pick predict-time parallelism for a freshly loaded model.
+
+    Forest predict fans out over trees with joblib's threading backend, but tree
+    traversal holds the GIL for part of each call, so on stock CPython extra
+    threads only contend. Without a GIL the trees scale across cores, so free-
+    threaded builds are the recommended runtime for bulk prediction.
+    """
+    if model is None or not hasattr(model, "n_jobs"):
+        return
+    model.n_jobs = -1 if FREE_THREADED else 1
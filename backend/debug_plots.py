@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Plot creation debug script
+Creates test plots directly and through the service layer, lists them, then cleans up
+"""
+import os
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Load environment variables from .env file BEFORE importing database
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+from sqlalchemy import delete
+from sqlmodel import Session, select
+from app.db.session import engine
+from app.models.yield_weather.farm import Farm, Plot, PlotCreate
+from app.services.plot_service import PlotService
+
+# Shared name prefix, so cleanup is an anchored LIKE 'TEST_PLOT_%' rather than a
+# leading-wildcard LIKE
+TEST_PLOT_PREFIX = "TEST_PLOT_"
+
+
+def test_plot_creation_direct(db, farm):
+    """Create a plot straight through the ORM"""
+    print("\n🧪 Direct plot creation...")
+    try:
+        plot = Plot(
+            farm_id=farm.id,
+            name=f"{TEST_PLOT_PREFIX}Direct",
+            area=0.5,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        )
+        db.add(plot)
+        db.commit()
+        db.refresh(plot)
+        print(f"   ✅ Created plot {plot.id} ({plot.name})")
+        return True
+    except Exception as e:
+        db.rollback()
+        print(f"   ❌ Direct creation failed: {e}")
+        return False
+
+
+def test_plot_creation_via_pydantic(db, farm):
+    """Create a plot from a PlotCreate payload through PlotService, like the API does"""
+    print("\n🧪 Plot creation via PlotCreate...")
+    try:
+        plot_data = PlotCreate(farm_id=farm.id, name=f"{TEST_PLOT_PREFIX}Pydantic", area=0.75)
+        plot = PlotService(db).create_plot(plot_data)
+        print(f"   ✅ Created plot {plot.id} ({plot.name})")
+        return True
+    except Exception as e:
+        db.rollback()
+        print(f"   ❌ PlotCreate creation failed: {e}")
+        return False
+
+
+def test_plot_listing(db, farm):
+    """List the farm's plots"""
+    print(f"\n📋 Plots for farm '{farm.name}':")
+    plots = db.exec(select(Plot).where(Plot.farm_id == farm.id).order_by(Plot.id)).all()
+    for plot in plots:
+        print(f"   - [{plot.id}] {plot.name}: {plot.area} ha ({plot.status})")
+    return True
+
+
+def cleanup_test_plots(db):
+    """Remove every plot created by these tests"""
+    print("\n🧹 Cleaning up test plots...")
+    # One server-side DELETE instead of loading each plot to delete it row by row;
+    # child rows go with them through the plots ON DELETE CASCADE foreign keys
+    result = db.execute(delete(Plot).where(Plot.name.startswith(TEST_PLOT_PREFIX, autoescape=True)))
+    db.commit()
+    print(f"   ✅ Deleted {result.rowcount} test plot(s)")
+    return True
+
+
+if __name__ == "__main__":
+    # One session (and pooled connection) shared by every test instead of one each
+    with Session(engine) as db:
+        farm = db.exec(select(Farm).limit(1)).first()
+        if farm is None:
+            print("❌ No farm found, run init_db.py first")
+        else:
+            results = [
+                test_plot_creation_direct(db, farm),
+                test_plot_creation_via_pydantic(db, farm),
+                test_plot_listing(db, farm),
+                cleanup_test_plots(db),
+            ]
+            print(f"\n📊 {sum(results)}/{len(results)} checks passed")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Database schema fix script
+Adds the columns the current farm/plot models expect to tables created by older
+setup scripts (e.g. setup_database.py), then verifies they are present
+"""
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from .env file BEFORE importing database
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+from sqlalchemy import text
+from app.db.session import engine
+
+# Columns missing from the minimal farms/plots tables, grouped by table
+SCHEMA_CHANGES = {
+    'farms': [
+        ('total_area', 'DOUBLE PRECISION NOT NULL DEFAULT 0'),
+        ('num_plots', 'INTEGER NOT NULL DEFAULT 1'),
+        ('latitude', 'DOUBLE PRECISION NOT NULL DEFAULT 0'),
+        ('longitude', 'DOUBLE PRECISION NOT NULL DEFAULT 0'),
+        ('active_plots_count', 'INTEGER NOT NULL DEFAULT 0'),
+        ('total_yield_kg', 'DOUBLE PRECISION NOT NULL DEFAULT 0'),
+        ('last_activity_date', 'TIMESTAMP'),
+        ('updated_at', 'TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP'),
+    ],
+    'plots': [
+        ('notes', 'VARCHAR(1000)'),
+        ('status', "VARCHAR(50) NOT NULL DEFAULT 'PREPARING'"),
+        ('planting_date', 'TIMESTAMP'),
+        ('expected_harvest_date', 'TIMESTAMP'),
+        ('age_months', 'INTEGER'),
+        ('progress_percentage', 'INTEGER NOT NULL DEFAULT 0'),
+        ('seedling_count', 'INTEGER NOT NULL DEFAULT 0'),
+        ('cinnamon_variety', "VARCHAR(100) NOT NULL DEFAULT 'Ceylon Cinnamon'"),
+        ('total_trees', 'INTEGER'),
+        ('last_planting_date', 'TIMESTAMP'),
+        ('last_yield_date', 'TIMESTAMP'),
+        ('planting_records_count', 'INTEGER NOT NULL DEFAULT 0'),
+        ('yield_records_count', 'INTEGER NOT NULL DEFAULT 0'),
+        ('trees_count', 'INTEGER NOT NULL DEFAULT 0'),
+        ('total_yield_kg', 'DOUBLE PRECISION NOT NULL DEFAULT 0'),
+        ('average_yield_per_harvest', 'DOUBLE PRECISION'),
+        ('best_yield_kg', 'DOUBLE PRECISION'),
+        ('health_score', 'DOUBLE PRECISION'),
+        ('estimated_next_harvest_date', 'TIMESTAMP'),
+        ('updated_at', 'TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP'),
+    ],
+}
+
+
+def existing_columns(conn):
+    """(table, column) pairs present for the tables in SCHEMA_CHANGES, from one catalog query"""
+    rows = conn.execute(text("""
+        SELECT table_name, column_name
+        FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = ANY(:tables)
+    """), {"tables": list(SCHEMA_CHANGES)})
+    return {(table, column) for table, column in rows}
+
+
+def missing_columns(columns):
+    """Expected (table, column, definition) entries not in the given column set"""
+    return [
+        (table, column, definition)
+        for table, table_columns in SCHEMA_CHANGES.items()
+        for column, definition in table_columns
+        if (table, column) not in columns
+    ]
+
+
+def apply_missing_schema_changes():
+    """Add every missing column with one ALTER TABLE per table, all in one transaction"""
+    print("🔧 Applying missing schema changes...")
+
+    # One statement per table takes each ACCESS EXCLUSIVE lock once instead of once
+    # per column, and engine.begin() commits everything together (or nothing)
+    with engine.begin() as conn:
+        by_table = {}
+        for table, column, definition in missing_columns(existing_columns(conn)):
+            by_table.setdefault(table, []).append((column, definition))
+
+        if not by_table:
+            print("   ✅ Nothing to change")
+            return
+
+        # Tables that already have every column are not locked at all
+        for table, columns in by_table.items():
+            clauses = ",\n    ".join(
+                f"ADD COLUMN IF NOT EXISTS {column} {definition}" for column, definition in columns
+            )
+            conn.execute(text(f"ALTER TABLE {table}\n    {clauses}"))
+            print(f"   ✅ {table}: added {len(columns)} column(s)")
+
+
+def verify_schema_changes():
+    """Check every expected column exists with a single information_schema query"""
+    print("🔍 Verifying schema changes...")
+
+    with engine.begin() as conn:
+        missing = missing_columns(existing_columns(conn))
+
+    if missing:
+        print("   ❌ Missing columns: " + ", ".join(f"{table}.{column}" for table, column, _ in missing))
+        return False
+    print("   ✅ All expected columns present")
+    return True
+
+
+def main():
+    try:
+        apply_missing_schema_changes()
+    except Exception as e:
+        print(f"❌ Schema update failed, no changes applied: {e}")
+        return False
+    return verify_schema_changes()
+
+
+if __name__ == "__main__":
+    if main():
+        print("🎉 Database schema is up to date!")
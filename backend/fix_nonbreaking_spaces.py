@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Non-breaking space fix script
+Replaces non-breaking/narrow spaces (and drops word joiners) pasted into Python sources
+"""
+import os
+import sys
+
+from source_files import expand_paths
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Every target codepoint handled by a single translate() pass
+TRANSLATION_TABLE = str.maketrans({
+    '\u00a0': ' ',   # no-break space
+    '\u202f': ' ',   # narrow no-break space
+    '\u2007': ' ',   # figure space
+    '\u2060': None,  # word joiner
+})
+
+
+def fix_file(filepath):
+    """Rewrite one file if it contains any of the target characters"""
+    # One UTF-8 decode on read and one encode on write, with no bytes copy held
+    # alongside; newline='' keeps CRLF files byte-identical apart from the fix
+    try:
+        with open(filepath, encoding='utf-8', newline='') as f:
+            text = f.read()
+    except UnicodeDecodeError as e:
+        print(f"   ⚠️  Skipped {os.path.relpath(filepath, BACKEND_DIR)}: not valid UTF-8 ({e.reason})")
+        return False
+    fixed = text.translate(TRANSLATION_TABLE)
+    if fixed == text:
+        return False
+
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        f.write(fixed)
+    print(f"   ✅ Fixed {os.path.relpath(filepath, BACKEND_DIR)}")
+    return True
+
+
+def main(paths):
+    print("🔍 Scanning for non-breaking spaces...")
+    files = expand_paths(paths)
+    fixed = sum(fix_file(path) for path in files)
+    print(f"📊 Fixed {fixed} of {len(files)} file(s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or [BACKEND_DIR])
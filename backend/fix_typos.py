@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Dunder typo fix script
+Repairs dunder names that lost their second underscore (e.g. `_name_`, `def _init_(`)
+"""
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from source_files import expand_paths
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# One alternation so every typo is found and rewritten in a single scan;
+# the group number of the match selects its replacement
+TYPO_PATTERN = re.compile(
+    r'(logging\.getLogger\(_name_\))'
+    r'|(def _init_\()'
+    r'|(super\(\)\._init_\()'
+    r'|(if _name_ == "_main_":)'
+    r'|(type\(e\)\._name_)'
+)
+# Same pattern over raw bytes, to scan a memory-mapped file without decoding it
+TYPO_PATTERN_BYTES = re.compile(TYPO_PATTERN.pattern.encode('utf-8'))
+REPLACEMENTS = {
+    1: 'logging.getLogger(__name__)',
+    2: 'def __init__(',
+    3: 'super().__init__(',
+    4: 'if __name__ == "__main__":',
+    5: 'type(e).__name__',
+}
+
+
+def _replace(match):
+    return REPLACEMENTS[match.lastindex]
+
+
+def fix_file(filepath):
+    """Rewrite one file if it contains any of the known typos; None if it is not valid UTF-8"""
+    # Scan the page-cache mapping first: files without a typo (every file after the
+    # first run) are never decoded, copied or written
+    with open(filepath, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not TYPO_PATTERN_BYTES.search(mm):
+                return False
+
+    # newline='' keeps CRLF files byte-identical apart from the fix
+    # Decode errors are returned rather than raised, so one bad file cannot abort
+    # the whole executor.map
+    try:
+        with open(filepath, encoding='utf-8', newline='') as f:
+            content = f.read()
+    except UnicodeDecodeError:
+        return None
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        f.write(TYPO_PATTERN.sub(_replace, content))
+    return True
+
+
+def main(paths):
+    print("🔍 Scanning for dunder typos...")
+    files_to_fix = expand_paths(paths, exclude={'fix_typos.py'})
+    if len(files_to_fix) > 1:
+        # Files are independent, so read/scan/rewrite them on separate workers
+        with ProcessPoolExecutor(max_workers=min(len(files_to_fix), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(fix_file, files_to_fix, chunksize=8))
+    else:
+        results = [fix_file(path) for path in files_to_fix]
+
+    for path, fixed in zip(files_to_fix, results):
+        if fixed is None:
+            print(f"   ⚠️  Skipped {os.path.relpath(path, BACKEND_DIR)}: not valid UTF-8")
+        elif fixed:
+            print(f"   ✅ Fixed {os.path.relpath(path, BACKEND_DIR)}")
+    print(f"📊 Fixed {sum(1 for fixed in results if fixed)} of {len(files_to_fix)} file(s)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or [BACKEND_DIR])
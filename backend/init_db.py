@@ -3,6 +3,7 @@
 Database initialization script
 Creates tables and adds sample data
 """
+import os
 import asyncio
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -10,9 +11,10 @@ from dotenv import load_dotenv
 # Load environment variables from .env file BEFORE importing database
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
 
-from sqlmodel import Session
+from sqlalchemy import exists, insert
+from sqlmodel import Session, select
 from app.db.session import engine, create_db_and_tables
-from app.models.farm import Farm, Plot, PlotStatus
+from app.models.yield_weather.farm import Farm, Plot, PlotStatus
 
 
 def init_database():
@@ -25,14 +27,15 @@ def init_database():
     
     # Add sample data
     with Session(engine) as session:
-        # Check if we already have sample data
-        existing_farms = session.query(Farm).first()
-        if existing_farms:
+        # Check if we already have sample data; EXISTS stops at the first row and
+        # returns a bool instead of hydrating a Farm object
+        if session.scalar(select(exists().select_from(Farm))):
             print("ℹ️  Sample data already exists, skipping...")
             return
         
-        # Create sample farm
-        sample_farm = Farm(
+        # Create sample farm; RETURNING hands back the generated id in the same
+        # round trip, so there is no intermediate commit + refresh SELECT
+        sample_farm = dict(
             name="Udari's Cinnamon Farm",
             owner_name="Udari Kumara",
             total_area=5.2,
@@ -41,42 +44,42 @@ def init_database():
             longitude=80.6234,
             created_at=datetime.utcnow()
         )
-        session.add(sample_farm)
-        session.commit()
-        session.refresh(sample_farm)
+        farm_id = session.execute(insert(Farm).values(**sample_farm).returning(Farm.id)).scalar_one()
         
         # Create sample plots
-        plot_a = Plot(
-            farm_id=sample_farm.id,
-            name="Plot A",
-            area=2.8,
-            status=PlotStatus.GROWING,
-            crop_type="Cinnamon",
-            planting_date=datetime.utcnow() - timedelta(days=365),  # 12 months ago
-            age_months=12,
-            progress_percentage=65,
-            notes="Young plants in good condition"
-        )
-        
-        plot_b = Plot(
-            farm_id=sample_farm.id,
-            name="Plot B",
-            area=2.4,
-            status=PlotStatus.MATURE,
-            crop_type="Cinnamon",
-            planting_date=datetime.utcnow() - timedelta(days=1095),  # 3 years ago
-            age_months=36,
-            progress_percentage=100,
-            notes="Mature plants ready for harvest"
-        )
+        sample_plots = [
+            dict(
+                farm_id=farm_id,
+                name="Plot A",
+                area=2.8,
+                status=PlotStatus.GROWING,
+                crop_type="Cinnamon",
+                planting_date=datetime.utcnow() - timedelta(days=365),  # 12 months ago
+                age_months=12,
+                progress_percentage=65,
+                notes="Young plants in good condition"
+            ),
+            dict(
+                farm_id=farm_id,
+                name="Plot B",
+                area=2.4,
+                status=PlotStatus.MATURE,
+                crop_type="Cinnamon",
+                planting_date=datetime.utcnow() - timedelta(days=1095),  # 3 years ago
+                age_months=36,
+                progress_percentage=100,
+                notes="Mature plants ready for harvest"
+            ),
+        ]
         
-        session.add(plot_a)
-        session.add(plot_b)
+        # A Core insert with a list of rows is sent as one executemany batch instead
+        # of a unit-of-work flush per object; column defaults still apply
+        session.execute(insert(Plot), sample_plots)
         session.commit()
         
-        print(f"✅ Sample farm '{sample_farm.name}' created with 2 plots")
-        print(f"   - {plot_a.name}: {plot_a.status} ({plot_a.progress_percentage}%)")
-        print(f"   - {plot_b.name}: {plot_b.status} ({plot_b.progress_percentage}%)")
+        print(f"✅ Sample farm '{sample_farm['name']}' created with {len(sample_plots)} plots")
+        for plot in sample_plots:
+            print(f"   - {plot['name']}: {plot['status']} ({plot['progress_percentage']}%)")
 
 
 if __name__ == "__main__":
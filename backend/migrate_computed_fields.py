@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Computed fields migration script
+Backfills the denormalized plot counters/yield statistics and the farm statistics
+derived from them, for rows created before the cascade handlers kept them current
+"""
+import os
+from dotenv import load_dotenv
+
+# Load environment variables from .env file BEFORE importing database
+load_dotenv(os.path.join(os.path.dirname(__file__), '..', '.env'))
+
+from sqlalchemy import text
+from app.db.session import engine
+
+# Each statement recomputes one group of plot fields for every plot at once, joining
+# plots against a GROUP BY aggregate; the LEFT JOIN gives plots without records zeros/NULLs.
+# PlotService.update_after_* remains the per-plot path the cascade handlers use.
+PLOT_YIELD_UPDATE = """
+    UPDATE plots
+    SET yield_records_count = agg.records,
+        total_yield_kg = agg.total,
+        average_yield_per_harvest = agg.average,
+        best_yield_kg = agg.best,
+        last_yield_date = agg.last_date,
+        updated_at = now() AT TIME ZONE 'utc'
+    FROM (
+        SELECT p.id AS plot_id,
+               COUNT(y.id) AS records,
+               COALESCE(SUM(y.yield_amount), 0) AS total,
+               AVG(y.yield_amount) AS average,
+               MAX(y.yield_amount) AS best,
+               MAX(y.yield_date) AS last_date
+        FROM plots p
+        LEFT JOIN user_yield_records y ON y.plot_id = p.id
+        GROUP BY p.id
+    ) agg
+    WHERE plots.id = agg.plot_id
+      AND (plots.yield_records_count, plots.total_yield_kg, plots.average_yield_per_harvest,
+           plots.best_yield_kg, plots.last_yield_date)
+          IS DISTINCT FROM (agg.records, agg.total, agg.average, agg.best, agg.last_date)
+"""
+
+PLOT_PLANTING_UPDATE = """
+    UPDATE plots
+    SET planting_records_count = agg.records,
+        last_planting_date = agg.last_date,
+        updated_at = now() AT TIME ZONE 'utc'
+    FROM (
+        SELECT p.id AS plot_id,
+               COUNT(r.id) AS records,
+               MAX(r.planted_date) AS last_date
+        FROM plots p
+        LEFT JOIN planting_records r ON r.plot_id = p.id
+        GROUP BY p.id
+    ) agg
+    WHERE plots.id = agg.plot_id
+      AND (plots.planting_records_count, plots.last_planting_date)
+          IS DISTINCT FROM (agg.records, agg.last_date)
+"""
+
+PLOT_TREES_UPDATE = """
+    UPDATE plots
+    SET trees_count = agg.trees,
+        updated_at = now() AT TIME ZONE 'utc'
+    FROM (
+        SELECT p.id AS plot_id, COUNT(t.id) AS trees
+        FROM plots p
+        LEFT JOIN trees t ON t.plot_id = p.id
+        GROUP BY p.id
+    ) agg
+    WHERE plots.id = agg.plot_id
+      AND plots.trees_count IS DISTINCT FROM agg.trees
+"""
+
+# Same fields FarmService.recalculate_farm_statistics derives, from the updated plots;
+# driven from farms so a farm whose plots were all deleted drops back to zero
+FARM_STATISTICS_UPDATE = """
+    UPDATE farms
+    SET num_plots = agg.plots,
+        active_plots_count = agg.active,
+        total_yield_kg = agg.total,
+        last_activity_date = COALESCE(agg.last_activity, farms.last_activity_date),
+        updated_at = now() AT TIME ZONE 'utc'
+    FROM (
+        SELECT f.id AS farm_id,
+               COUNT(p.id) AS plots,
+               COUNT(p.id) FILTER (WHERE p.status IN ('GROWING', 'HARVESTING', 'MATURE')) AS active,
+               COALESCE(SUM(p.total_yield_kg), 0) AS total,
+               GREATEST(MAX(p.last_yield_date), MAX(p.last_planting_date)) AS last_activity
+        FROM farms f
+        LEFT JOIN plots p ON p.farm_id = f.id
+        GROUP BY f.id
+    ) agg
+    WHERE farms.id = agg.farm_id
+"""
+
+STATEMENTS = [
+    ('plot yield statistics', PLOT_YIELD_UPDATE),
+    ('plot planting statistics', PLOT_PLANTING_UPDATE),
+    ('plot tree counts', PLOT_TREES_UPDATE),
+    ('farm statistics', FARM_STATISTICS_UPDATE),
+]
+
+
+def populate_computed_fields():
+    """Recompute every plot and farm computed field with a few set-based UPDATEs"""
+    print("🔄 Populating computed fields...")
+
+    # A handful of aggregate UPDATEs instead of several SELECTs per plot; one
+    # transaction, so farms never see half-updated plot statistics
+    with engine.begin() as conn:
+        for label, statement in STATEMENTS:
+            result = conn.execute(text(statement))
+            print(f"   ✅ {label}: {result.rowcount} row(s) updated")
+
+
+def main():
+    try:
+        populate_computed_fields()
+    except Exception as e:
+        print(f"❌ Computed field migration failed, no changes applied: {e}")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    if main():
+        print("🎉 Computed fields are up to date!")
@@ -5,7 +5,6 @@ Connects to AWS RDS PostgreSQL database and initializes tables
 """
 import psycopg2
 import os
-from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
 from dotenv import load_dotenv
 
 # Load environment variables from parent directory
@@ -34,15 +33,16 @@ def setup_database():
             password=password,
             sslmode='require'  # AWS RDS requires SSL
         )
-        conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
         cursor = conn.cursor()
         
         print("✅ Connected to AWS RDS PostgreSQL database")
         
         # Create tables directly (no need to create a separate database on RDS)
-        print("🏗️  Creating tables in AWS RDS database...")
+        print("🏗️  Creating tables and sample data in AWS RDS database...")
         
-        # Create a simple test table
+        # psycopg2 has no pipeline mode, but it sends a multi-statement string as one
+        # simple query: the DDL and the seed INSERT go out in a single round trip
+        # instead of one per statement, and the server runs them in one transaction
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS farms (
                 id SERIAL PRIMARY KEY,
@@ -51,9 +51,7 @@ def setup_database():
                 location VARCHAR(255),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
-        """)
-        
-        cursor.execute("""
+            
             CREATE TABLE IF NOT EXISTS plots (
                 id SERIAL PRIMARY KEY, 
                 farm_id INTEGER REFERENCES farms(id),
@@ -62,19 +60,14 @@ def setup_database():
                 crop_type VARCHAR(100),
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             );
-        """)
-        
-        conn.commit()
-        print("✅ Tables created successfully")
-        
-        # Insert sample data
-        cursor.execute("""
+            
             INSERT INTO farms (name, owner_name, location) 
             VALUES (%s, %s, %s) 
-            ON CONFLICT DO NOTHING
+            ON CONFLICT DO NOTHING;
         """, ("Sample Farm", "Udari Kumara", "Matale, Sri Lanka"))
         
         conn.commit()
+        print("✅ Tables created successfully")
         print("✅ Sample data inserted")
         
         cursor.close()
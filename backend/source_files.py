@@ -0,0 +1,36 @@
+"""
+Python source walker shared by the backend fix_*.py scripts
+Yields the project's own .py files, skipping caches, VCS metadata and virtualenvs
+"""
+import os
+
+# Directory names that never hold project sources
+EXCLUDED_DIRS = {
+    '__pycache__', '.git', 'node_modules', '.mypy_cache', '.pytest_cache',
+    'venv', '.venv', 'env', 'ENV', 'site-packages', 'dist-packages', 'build', 'dist',
+}
+
+
+def _is_virtualenv(path):
+    # Any virtualenv, whatever its name, has a pyvenv.cfg at its root
+    return os.path.exists(os.path.join(path, 'pyvenv.cfg'))
+
+
+def python_files(root, exclude=()):
+    """Every .py file under root, except in excluded directories and virtualenvs"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [
+            d for d in dirnames
+            if d not in EXCLUDED_DIRS and not _is_virtualenv(os.path.join(dirpath, d))
+        ]
+        for filename in filenames:
+            if filename.endswith('.py') and filename not in exclude:
+                yield os.path.join(dirpath, filename)
+
+
+def expand_paths(paths, exclude=()):
+    """Files given directly plus the Python files under any directories given"""
+    return [
+        p for path in paths
+        for p in (python_files(path, exclude) if os.path.isdir(path) else [path])
+    ]
@@ -10,11 +10,12 @@ Uses kagglehub for seamless pandas DataFrame loading
 
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
+from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV, ShuffleSplit
+from sklearn.preprocessing import LabelEncoder
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 import joblib
+from joblib import Parallel, delayed
 import os
 from typing import Dict, Any, Tuple, Optional, List
 import warnings
@@ -30,6 +31,55 @@ except ImportError:
     print("⚠️ kagglehub not available. Install with: pip install kagglehub[pandas-datasets]")
     KAGGLEHUB_AVAILABLE = False
 
+# Optional multithreaded CSV parser
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Optional fast compressor for saved models; joblib falls back to zlib without it
+try:
+    import lz4  # noqa: F401
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+# Numeric columns across the yield datasets, read straight as float32 instead of
+# letting pandas infer (and upcast) them
+CSV_FLOAT_COLUMNS = (
+    'area', 'area_hectares', 'yield_amount', 'yield_kg', 'rainfall', 'rainfall_mm',
+    'temperature', 'temperature_c', 'age_years'
+)
+
+
+def evaluate_model(name: str, model, X_train, y_train, X_test, y_test, cv) -> Tuple[str, Any, Dict[str, Any]]:
+    """Fit one candidate model, cross-validate it and score it on the test split"""
+    # Train model
+    model.fit(X_train, y_train)
+    
+    # Cross-validation
+    cv_scores = cross_val_score(model, X_train, y_train, cv=cv, scoring='r2')
+    
+    # Test predictions
+    y_pred = model.predict(X_test)
+    
+    metrics = {
+        'model_name': name,
+        'cv_r2': cv_scores.mean(),
+        'cv_std': cv_scores.std(),
+        'test_r2': r2_score(y_test, y_pred),
+        'test_mae': mean_absolute_error(y_test, y_pred)
+    }
+    # Size diagnostics: out-of-bag R² for forests (to see whether more trees still help)
+    # and the number of boosting rounds early stopping actually kept
+    if hasattr(model, 'oob_score_'):
+        metrics['oob_r2'] = model.oob_score_
+    if hasattr(model, 'n_iter_'):
+        metrics['n_iter'] = model.n_iter_
+    
+    return name, model, metrics
+
 
 class CompleteModelTrainer:
     """Complete model training system for hybrid yield prediction"""
@@ -43,9 +93,15 @@ class CompleteModelTrainer:
         os.makedirs(self.tree_models_dir, exist_ok=True)
         os.makedirs(self.plot_models_dir, exist_ok=True)
         
+        # Cross-validation is only used to pick between candidates, so a few shuffled
+        # 70/30 splits are enough; raise for tighter estimates
+        self.cv_splits = 3
+        
+        # Forest size; raise only while the reported out-of-bag R² keeps improving
+        self.n_estimators = 100
+        
         # Initialize model storage
         self.models = {}
-        self.scalers = {}
         self.encoders = {}
         self.feature_names = {}
     
@@ -97,19 +153,19 @@ class CompleteModelTrainer:
                 
                 if 'tree_level' in filename.lower():
                     print(f"\n📊 Loading tree dataset: {filename}")
-                    tree_data = pd.read_csv(csv_file)
+                    tree_data = self._read_csv(csv_file)
                     print(f"   ✅ Tree data: {tree_data.shape[0]} rows × {tree_data.shape[1]} columns")
                     print(f"   Columns: {list(tree_data.columns)}")
                     
                 elif 'aggregated_yield' in filename.lower():
                     print(f"\n📊 Loading yield dataset: {filename}")
-                    yield_data = pd.read_csv(csv_file)
+                    yield_data = self._read_csv(csv_file)
                     print(f"   ✅ Yield data: {yield_data.shape[0]} rows × {yield_data.shape[1]} columns")
                     print(f"   Columns: {list(yield_data.columns)}")
                     
                 elif 'enhanced_plot' in filename.lower():
                     print(f"\n📊 Loading enhanced plot dataset: {filename}")
-                    enhanced_data = pd.read_csv(csv_file)
+                    enhanced_data = self._read_csv(csv_file)
                     print(f"   ✅ Enhanced data: {enhanced_data.shape[0]} rows × {enhanced_data.shape[1]} columns")
                     print(f"   Columns: {list(enhanced_data.columns)}")
             
@@ -148,7 +204,7 @@ class CompleteModelTrainer:
         
         for dataset_name, file_path in local_files.items():
             if os.path.exists(file_path):
-                datasets[dataset_name] = pd.read_csv(file_path)
+                datasets[dataset_name] = self._read_csv(file_path)
                 print(f"   {dataset_name}: {len(datasets[dataset_name])} samples")
             else:
                 missing_files.append(file_path)
@@ -164,6 +220,13 @@ class CompleteModelTrainer:
             datasets.get('enhanced_data', pd.DataFrame())
         )
     
+    def _read_csv(self, path: str) -> pd.DataFrame:
+        """Read a dataset CSV with explicit dtypes for its known numeric columns"""
+        # The files differ in layout, so only type the columns this one actually has
+        header = pd.read_csv(path, nrows=0).columns
+        dtype = {col: np.float32 for col in CSV_FLOAT_COLUMNS if col in header}
+        return pd.read_csv(path, dtype=dtype, engine='pyarrow' if PYARROW_AVAILABLE else 'c')
+    
     def load_single_kaggle_dataset(self, dataset_handle: str = "udaridevindi/cinogrow-yield-prediction-dataset", file_path: str = "") -> pd.DataFrame:
         """
         Load a single dataset from Kaggle - useful for testing
@@ -194,6 +257,62 @@ class CompleteModelTrainer:
             print(f"❌ Failed to load dataset: {e}")
             raise
     
+    def _save_bundle(self, path: str, model, encoders: Dict[str, Any], feature_names: List[str]):
+        """Save model, encoders and feature names as one compressed artifact"""
+        # One file means one open/read at load time instead of three.
+        # 'scaler' is None: the tree models take unscaled features.
+        # lz4 decompresses faster than the disk can deliver the uncompressed bytes.
+        # Dump next to the target, fsync, then rename so a reloading service
+        # sees either the previous bundle or the complete new one, never a partial file
+        tmp_path = f"{path}.tmp"
+        joblib.dump({
+            'model': model,
+            'scaler': None,
+            'encoders': encoders,
+            'feature_names': feature_names
+        }, tmp_path, compress=('lz4', 3) if LZ4_AVAILABLE else 3)
+        with open(tmp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    def _select_best_model(self, models: Dict[str, Any], X_train, y_train, X_test, y_test) -> Tuple[Any, Dict[str, Any]]:
+        """Evaluate the candidate models concurrently and return the best one by CV R²"""
+        # The candidates are independent, so evaluate them in parallel worker processes.
+        # RandomForest runs with n_jobs=1 and loky caps each worker's OpenMP threads to
+        # its share of the cores, so the two workers do not oversubscribe the CPU.
+        cv = ShuffleSplit(n_splits=self.cv_splits, test_size=0.3, random_state=42)
+        results = Parallel(n_jobs=len(models), backend='loky')(
+            delayed(evaluate_model)(name, model, X_train, y_train, X_test, y_test, cv)
+            for name, model in models.items()
+        )
+        
+        best_model = None
+        best_metrics = {'cv_r2': -float('inf')}
+        for name, model, metrics in results:
+            print(f"   {name}: CV R² = {metrics['cv_r2']:.3f} ± {metrics['cv_std']:.3f}, Test R² = {metrics['test_r2']:.3f}")
+            if 'oob_r2' in metrics:
+                print(f"      OOB R² = {metrics['oob_r2']:.3f} with {self.n_estimators} trees")
+            if 'n_iter' in metrics:
+                print(f"      Early stopping kept {metrics['n_iter']} boosting rounds")
+            
+            if metrics['cv_r2'] > best_metrics['cv_r2']:
+                best_model, best_metrics = model, metrics
+        
+        return best_model, best_metrics
+    
+    def _encode_categorical(self, values: pd.Series) -> Tuple[np.ndarray, LabelEncoder]:
+        """Integer-code a categorical column from pandas category codes"""
+        categorical = values.fillna('unknown').astype('category')
+        
+        # Inferred categories come out sorted, so the codes are exactly what
+        # LabelEncoder.fit_transform would return, without its unique + searchsorted
+        # passes. A LabelEncoder carrying the same classes_ is still saved because the
+        # prediction-side loaders look values up in classes_.
+        encoder = LabelEncoder()
+        encoder.classes_ = categorical.cat.categories.to_numpy()
+        
+        return categorical.cat.codes.to_numpy(np.int32), encoder
+    
     def train_tree_cane_model(self, tree_data: pd.DataFrame) -> Dict[str, Any]:
         """Train tree-level cane prediction model adapted to available columns"""
         print("\n🌳 Training Yield Prediction Model (Tree Level)...")
@@ -228,18 +347,24 @@ class CompleteModelTrainer:
         
         # Encode categorical variables
         for col in categorical_features:
-            encoder = LabelEncoder()
-            data[f'{col}_encoded'] = encoder.fit_transform(data[col].fillna('unknown'))
-            encoders[col] = encoder
+            data[f'{col}_encoded'], encoders[col] = self._encode_categorical(data[col])
             available_features.append(f'{col}_encoded')
         
         # Add engineered features if possible
         if 'rainfall' in data.columns and 'temperature' in data.columns:
-            data['growing_condition_index'] = data['rainfall'] / 1000 * np.exp(-(data['temperature'] - 27)**2 / 50)
+            # rainfall / 1000 * exp(-(temperature - 27)^2 / 50), computed in place in
+            # one buffer instead of materializing a temporary per operator
+            index = data['temperature'].to_numpy(dtype=float) - 27
+            index *= index
+            index *= -1 / 50
+            np.exp(index, out=index)
+            index *= data['rainfall'].to_numpy(dtype=float)
+            index *= 0.001
+            data['growing_condition_index'] = index
             available_features.append('growing_condition_index')
         
         if 'area' in data.columns and 'age_years' in data.columns:
-            data['maturity_index'] = data['area'] * data['age_years']
+            data['maturity_index'] = data['area'].to_numpy(dtype=float) * data['age_years'].to_numpy(dtype=float)
             available_features.append('maturity_index')
         
         print(f"   Using {len(available_features)} features for training")
@@ -255,53 +380,21 @@ class CompleteModelTrainer:
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
-        # Scale features
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
+        # Tree ensembles split on per-feature thresholds, so scaling would change nothing
+        X_train = X_train.to_numpy(dtype=np.float32)
+        X_test = X_test.to_numpy(dtype=np.float32)
         
         # Try different models
         models = {
-            'RandomForest': RandomForestRegressor(n_estimators=100, max_depth=10, random_state=42),
-            'GradientBoosting': GradientBoostingRegressor(n_estimators=100, max_depth=6, random_state=42)
+            'RandomForest': RandomForestRegressor(n_estimators=self.n_estimators, max_depth=10, oob_score=True, n_jobs=1, random_state=42),
+            'HistGradientBoosting': HistGradientBoostingRegressor(max_iter=300, max_depth=6, learning_rate=0.1, early_stopping=True, random_state=42)
         }
         
-        best_model = None
-        best_score = -float('inf')
-        best_metrics = {}
-        
-        for name, model in models.items():
-            # Train model
-            model.fit(X_train_scaled, y_train)
-            
-            # Cross-validation
-            cv_scores = cross_val_score(model, X_train_scaled, y_train, cv=5, scoring='r2')
-            
-            # Test predictions
-            y_pred = model.predict(X_test_scaled)
-            test_r2 = r2_score(y_test, y_pred)
-            test_mae = mean_absolute_error(y_test, y_pred)
-            
-            print(f"   {name}: CV R² = {cv_scores.mean():.3f} ± {cv_scores.std():.3f}, Test R² = {test_r2:.3f}")
-            
-            if cv_scores.mean() > best_score:
-                best_score = cv_scores.mean()
-                best_model = model
-                best_metrics = {
-                    'model_name': name,
-                    'cv_r2': cv_scores.mean(),
-                    'cv_std': cv_scores.std(),
-                    'test_r2': test_r2,
-                    'test_mae': test_mae
-                }
+        best_model, best_metrics = self._select_best_model(models, X_train, y_train, X_test, y_test)
         
         # Save best model
-        joblib.dump(best_model, f"{self.tree_models_dir}/tree_cane_model.joblib")
-        joblib.dump(scaler, f"{self.tree_models_dir}/tree_cane_scaler.joblib")
-        joblib.dump({
-            'encoders': encoders,
-            'feature_names': available_features
-        }, f"{self.tree_models_dir}/tree_cane_encoders.joblib")
+        self._save_bundle(f"{self.tree_models_dir}/tree_cane_bundle.joblib",
+                          best_model, encoders, available_features)
         
         print(f"   ✅ Best model: {best_metrics['model_name']} (R² = {best_metrics['cv_r2']:.3f})")
         
@@ -365,14 +458,12 @@ class CompleteModelTrainer:
         
         # Fill missing numerical values
         for col in features:
-            if col in data.columns and data[col].dtype in ['float64', 'int64']:
+            if col in data.columns and pd.api.types.is_numeric_dtype(data[col]):
                 data[col] = data[col].fillna(data[col].median())
         
         # Encode categorical variables
         for col in categorical_features:
-            encoder = LabelEncoder()
-            data[f'{col}_encoded'] = encoder.fit_transform(data[col].fillna('unknown'))
-            encoders[col] = encoder
+            data[f'{col}_encoded'], encoders[col] = self._encode_categorical(data[col])
             features.append(f'{col}_encoded')
         
         # Add engineered features
@@ -386,7 +477,7 @@ class CompleteModelTrainer:
         # Fill any remaining NaN values in features
         for col in features:
             if col in data.columns:
-                data[col] = data[col].fillna(data[col].median() if data[col].dtype in ['float64', 'int64'] else 0)
+                data[col] = data[col].fillna(data[col].median() if pd.api.types.is_numeric_dtype(data[col]) else 0)
         
         # Prepare target and features
         X = data[features]
@@ -403,53 +494,21 @@ class CompleteModelTrainer:
         # Split data
         X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
         
-        # Scale features
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
+        # Tree ensembles split on per-feature thresholds, so scaling would change nothing
+        X_train = X_train.to_numpy(dtype=np.float32)
+        X_test = X_test.to_numpy(dtype=np.float32)
         
         # Try different models with hyperparameter tuning
         models = {
-            'RandomForest': RandomForestRegressor(n_estimators=150, max_depth=12, random_state=42),
-            'GradientBoosting': GradientBoostingRegressor(n_estimators=150, max_depth=8, learning_rate=0.1, random_state=42)
+            'RandomForest': RandomForestRegressor(n_estimators=self.n_estimators, max_depth=12, oob_score=True, n_jobs=1, random_state=42),
+            'HistGradientBoosting': HistGradientBoostingRegressor(max_iter=300, max_depth=8, learning_rate=0.1, early_stopping=True, random_state=42)
         }
         
-        best_model = None
-        best_score = -float('inf')
-        best_metrics = {}
-        
-        for name, model in models.items():
-            # Train model
-            model.fit(X_train_scaled, y_train)
-            
-            # Cross-validation
-            cv_scores = cross_val_score(model, X_train_scaled, y_train, cv=5, scoring='r2')
-            
-            # Test predictions
-            y_pred = model.predict(X_test_scaled)
-            test_r2 = r2_score(y_test, y_pred)
-            test_mae = mean_absolute_error(y_test, y_pred)
-            
-            print(f"   {name}: CV R² = {cv_scores.mean():.3f} ± {cv_scores.std():.3f}, Test R² = {test_r2:.3f}")
-            
-            if cv_scores.mean() > best_score:
-                best_score = cv_scores.mean()
-                best_model = model
-                best_metrics = {
-                    'model_name': name,
-                    'cv_r2': cv_scores.mean(),
-                    'cv_std': cv_scores.std(),
-                    'test_r2': test_r2,
-                    'test_mae': test_mae
-                }
+        best_model, best_metrics = self._select_best_model(models, X_train, y_train, X_test, y_test)
         
         # Save best model
-        joblib.dump(best_model, f"{self.plot_models_dir}/plot_yield_model.joblib")
-        joblib.dump(scaler, f"{self.plot_models_dir}/plot_yield_scaler.joblib")
-        joblib.dump({
-            'encoders': encoders,
-            'feature_names': features
-        }, f"{self.plot_models_dir}/plot_yield_encoders.joblib")
+        self._save_bundle(f"{self.plot_models_dir}/plot_yield_bundle.joblib",
+                          best_model, encoders, features)
         
         print(f"   ✅ Best model: {best_metrics['model_name']} (R² = {best_metrics['cv_r2']:.3f})")
         